@@ -1,4 +1,6 @@
-import subprocess
+import contextlib
+import io
+import sys
 
 # Define the sequence of inputs
 inputs = [
@@ -6,19 +8,28 @@ inputs = [
     '1436.ninja\n',  # Server hostname
     '23\n',          # Selector '23'
     '9\n',           # Selector '9'
-    'b\n'            # 'b' for back
+    'b\n',           # 'b' for back
+    'q\n',           # 'q' to quit from a page prompt
+    '7\n'            # Quit from the main menu, in case navigation ended early
 ]
 
 # Convert the inputs list to a single string
 input_sequence = ''.join(inputs)
 
-# Run the gopher program and send the input sequence
-process = subprocess.run(
-    ['python', 'C:/Users/TUF505GT/gopher/gopherTESTING.py'],
-    input=input_sequence,
-    text=True,
-    capture_output=True
-)
+# Run the gopher client in-process, feeding it the input sequence and capturing its output.
+# Like the old subprocess run, stderr (log output and tracebacks) is captured but not printed.
+output = io.StringIO()
+errors = io.StringIO()
+sys.stdin = io.StringIO(input_sequence)
+try:
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+        # Imported here so the client's log handler writes to the captured stderr
+        import gopherTESTING
+        gopherTESTING.main()
+except EOFError:
+    pass  # The input sequence ran out before the client quit
+finally:
+    sys.stdin = sys.__stdin__
 
 # Print the output
-print(process.stdout)
+print(output.getvalue())
@@ -1,34 +1,92 @@
 import json
 import os
+import re
+import threading
 import socket
 import logging
 import time
-import sys
-from urllib.parse import urlparse
+from collections import deque, namedtuple
+from concurrent.futures import Future, wait
+
+try:
+    import orjson
+
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _loads(raw):
+        return orjson.loads(raw)
+except ImportError:
+    def _dumps(data):
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _loads(raw):
+        return json.loads(raw)
 
 CONFIG_FILE = 'config.json'
 BOOKMARKS_FILE = 'bookmarks.json'
 SEARCH_ENGINES_FILE = 'search_engines.json'
 HISTORY_FILE='navigation_history.json'
+RECV_BUFSIZE = 32 * 1024
+_CRLF = b"\r\n"
+SAVE_COALESCE_DELAY = 0.1  # Seconds to wait for further saves before writing to disk
+LOG_FORMAT = '%(levelname)s:%(name)s:[%(funcName)s:%(lineno)d] %(message)s'
+PREFETCH_MAX_HOSTS = 3
+PREFETCH_ENTRY_TYPES = ('0', '1')  # Text files and menus, the entries the user can follow
+
+# 2-252 characters of dot-separated labels, each 1-63 alphanumerics/hyphens not starting or ending with '-'
+_HOSTNAME_RE = re.compile(
+    r'(?=.{2,252}\Z)[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*')
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+
+def _close_prefetched_socket(future):
+    """Done-callback closing the socket of a prefetch nobody claimed."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _decode(raw):
+    """Decode raw response bytes for display."""
+    return raw.decode('utf-8', errors='replace')
+
+
+HistoryEntry = namedtuple('HistoryEntry', ['server', 'port', 'selector'])
+
+
+def _write_json_atomic(filename, data):
+    """Write data to a temporary file and atomically swap it into place."""
+    tmp_filename = filename + ".tmp"
+    try:
+        with open(tmp_filename, 'wb') as f:
+            f.write(_dumps(data))
+        os.replace(tmp_filename, filename)
+    except Exception:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
 
 class ImprovedHistoryManager:
     def __init__(self, max_history=5, history_file=None):
-        self.backward_history = []
-        self.forward_history = []
+        self.backward_history = deque(maxlen=max_history)
+        self.forward_history = deque(maxlen=max_history)
         self.max_history = max_history
         self.history_file = history_file
+        self.logging = logger
 
     def record(self, address):
-        """Record an address in the history."""
+        """Record a HistoryEntry in the history."""
         self.backward_history.append(address)
-        self.forward_history = []
+        self.forward_history.clear()
 
     def add_page(self, page):
-        """Add a page to the history."""
+        """Add a page (a HistoryEntry) to the history."""
         print(f"Attempting to add: {page}")
         if not self.backward_history or self.backward_history[-1] != page:
-            if len(self.backward_history) == self.max_history:
-                self.backward_history.pop(0)
             self.backward_history.append(page)
             self.forward_history.clear()
         else:
@@ -44,7 +102,7 @@ class ImprovedHistoryManager:
         self.forward_history.append(last_address)
 
         # Add a debug log here to check the state of backward_history
-        self.logging.debug(f"History after going back: {self.backward_history}")
+        self.logging.debug("History after going back: %s", self.backward_history)
 
         if self.backward_history:
             return self.backward_history[-1]
@@ -69,41 +127,76 @@ class ImprovedHistoryManager:
     def _save_history(self):
         """Save current history state to the history file."""
         if self.history_file:
-            with open(self.history_file, 'w') as f:
-                json.dump({
-                    'backward': self.backward_history,
-                    'forward': self.forward_history
-                }, f)
-                print("History saved.")
+            _write_json_atomic(self.history_file, self.serialize())
+            print("History saved.")
+
+    def serialize(self):
+        """Return both history stacks as JSON-friendly lists of server/port/selector dicts."""
+        return {
+            'backward': [entry._asdict() for entry in self.backward_history],
+            'forward': [entry._asdict() for entry in self.forward_history]
+        }
+
+    def restore(self, backward, forward):
+        """Replace both history stacks with entries previously produced by serialize()."""
+        self.backward_history = deque(self._parse_entries(backward), maxlen=self.max_history)
+        self.forward_history = deque(self._parse_entries(forward), maxlen=self.max_history)
+
+    def _parse_entries(self, entries):
+        """Yield HistoryEntry objects from saved entries, skipping any that are malformed."""
+        for entry in entries:
+            try:
+                if isinstance(entry, dict):
+                    yield HistoryEntry(**entry)
+                    continue
+                if isinstance(entry, (list, tuple)):
+                    yield HistoryEntry(*entry)
+                    continue
+            except TypeError:
+                pass
+            self.logging.warning("Skipping malformed history entry: %r", entry)
 
 class GopherClient:
+    # Main menu: key -> (description, name of the method handling it)
+    MENU_OPTIONS = {
+        "1": ("Connect to a Gopher server", "connect_to_server"),
+        "2": ("Search Gopherspace", "search_gopherspace"),
+        "3": ("List bookmarks", "list_bookmarks"),
+        "4": ("Navigate to a bookmarked server", "navigate_to_bookmark"),
+        "5": ("Save configuration", "save_config"),
+        "6": ("Load configuration", "load_config"),
+        "7": ("Quit", "quit_client"),
+        "8": ("Help", "display_help"),
+        "9": ("Toggle Debug Mode", "toggle_debug_mode")
+    }
+
     def __init__(self, host='1436.ninja', port=70, timeout=10, debug=False):
-        logging.basicConfig(level=logging.DEBUG if debug else logging.WARNING)
-        self.logging = logging.getLogger('GopherClient')
+        self.logging = logger
+        self.logging.setLevel(logging.DEBUG if debug else logging.WARNING)
         self.host = host
         self.port = port
         self.timeout = timeout
         self.debug = debug
         self.socket = None
+        self._conn_pool = {}
+        self._prefetch = {}
+        self._file_cache = {}
+        self._pending_saves = {}
+        self._save_lock = threading.Lock()
+        self._save_timer = None
         self.bookmarks = self.load_bookmarks()
+        self._index_bookmarks()
         self.search_engines = self.load_search_engines()
+        self._search_engines_by_name = {e['name']: e for e in self.search_engines}
         self.history_manager = ImprovedHistoryManager(history_file=HISTORY_FILE)
         self.is_navigating_back = False
-
-    def _debug_print(self, message):
-        if self.debug:  # Check if debug mode is on
-            self.logging.debug(message)
+        self._quit = False
+        self._menu_banner = "\nOptions:\n" + "\n".join(
+            f"{key}. {description}" for key, (description, _) in self.MENU_OPTIONS.items())
 
     @staticmethod
     def valid_hostname(hostname):
-        if not 1 < len(hostname) < 253:
-            return False
-        for label in hostname.split("."):
-            if not (1 <= len(label) <= 63) or not label[-1].isalnum() or not label[0].isalnum() or label.startswith(
-                    '-') or label.endswith('-'):
-                return False
-
-        return True
+        return bool(_HOSTNAME_RE.fullmatch(hostname))
 
     def connect_to_server(self):
         host = input("Enter Gopher server hostname: ").strip()
@@ -111,7 +204,6 @@ class GopherClient:
             return
         self.host = host
         self.port = 70  # default Gopher port
-        self._establish_connection()
         # Provide an empty string as the selector to fetch the root directory/main menu
         self.navigate(selector="", server=self.host, port=self.port)
 
@@ -121,16 +213,19 @@ class GopherClient:
 
     def search_gopherspace(self):
         engine = input("Choose a search engine (e.g., 'Veronica-2', 'Contrition - All Types'): ").strip()
-        if engine in [e['name'] for e in self.search_engines]:
+        if engine in self._search_engines_by_name:
             query = input("Enter search query: ").strip()
             self.search(query, engine)
         else:
             print(f"Search engine {engine} not found.")
 
     def quit_client(self):
-        if self.socket:
-            self.socket.close()
-        exit(0)
+        self._discard_prefetch()
+        self._flush_saves()
+        for key in list(self._conn_pool):
+            self._socket_release(*key)
+        # Let run() and any in-progress navigation unwind instead of raising SystemExit
+        self._quit = True
 
     def toggle_debug_mode(self):
         self.debug = not self.debug
@@ -142,51 +237,31 @@ class GopherClient:
 
     def run(self):
         """Main loop to interact with the user."""
-        options = {
-            "1": ("Connect to a Gopher server", self.connect_to_server),
-            "2": ("Search Gopherspace", self.search_gopherspace),
-            "3": ("List bookmarks", self.list_bookmarks),
-            "4": ("Navigate to a bookmarked server", self.navigate_to_bookmark),  # Added this line
-            "5": ("Save configuration", self.save_config),
-            "6": ("Load configuration", self.load_config),
-            "7": ("Quit", self.quit_client),
-            "8": ("Help", self.display_help),
-            "9": ("Toggle Debug Mode", self.toggle_debug_mode)
-        }
-
-        while True:
-            print("\nOptions:")
-            for key, (description, _) in options.items():
-                print(f"{key}. {description}")
+        while not self._quit:
+            print(self._menu_banner)
             choice = input("> ").strip()
 
-            action = options.get(choice, (None, None))[1]
+            action = self.MENU_OPTIONS.get(choice, (None, None))[1]
             if action:
-                action()
+                getattr(self, action)()
             else:
                 print("Invalid choice. Please try again.")
 
-    def connect(self, host=None, port=None):
-        if host:
-            self.host = host
-        if port:
-            self.port = port
-        self._establish_connection()
-
     def navigate(self, selector, record_history=True, server=None, port=70):
-        self._ensure_connection()
-        self.logging.debug(f"Navigating with selector: {selector}")
+        self.logging.debug("Navigating with selector: %s", selector)
 
         # Debug statement to monitor the history state during navigation
-        self.logging.debug(f"Current history state: {self.history_manager.backward_history}")
+        self.logging.debug("Current history state: %s", self.history_manager.backward_history)
 
         try:
             data = self._send_request(selector, server, port)
             if not data:
                 return
 
-            if '\t' in data:
+            if b'\t' in data:
                 selected_selector, new_server, new_port = self._display_gopher_menu(data)
+                if self._quit:
+                    return
                 if selected_selector is not None:
                     navigate_server = new_server if new_server else self.host
                     navigate_port = int(new_port) if new_port else self.port
@@ -195,23 +270,26 @@ class GopherClient:
                     action = self._handle_user_choice(data)
                     if action == "BACK":
                         # Debug statement to monitor the history state before going back
-                        self.logging.debug(
-                            f"Current history state before going back: {self.history_manager.backward_history}")
+                        self.logging.debug("Current history state before going back: %s",
+                                           self.history_manager.backward_history)
                         return
             else:
                 action = self._handle_user_choice(data)
                 if action == "BACK":
                     # Debug statement to monitor the history state before going back
-                    self.logging.debug(
-                        f"Current history state before going back: {self.history_manager.backward_history}")
+                    self.logging.debug("Current history state before going back: %s",
+                                       self.history_manager.backward_history)
                     return
 
+            if self._quit:
+                return
+
             # Record the navigation history if the flag is set
             if record_history:
-                current_address = (server, port)
+                current_address = HistoryEntry(server or self.host, int(port or self.port), selector)
                 self.history_manager.record(current_address)
                 # Add a debug log here to check the state of backward_history after each navigation
-                self.logging.debug(f"History after navigation: {self.history_manager.backward_history}")
+                self.logging.debug("History after navigation: %s", self.history_manager.backward_history)
 
         except Exception as e:
             self._error_handler(f"Error while navigating: {e}", debug_info=e)
@@ -221,7 +299,7 @@ class GopherClient:
         Handle the choice when a user encounters a non-menu item.
         """
         self.logging.debug("Handling user choice for non-menu data.")
-        print(data)
+        print(_decode(data))
 
         while True:
             choice = input("\nPress 'b' to go back or 'q' to quit:\n> ").strip().lower()
@@ -229,14 +307,14 @@ class GopherClient:
             if choice == 'b':
                 previous_page = self.history_manager.go_back()
                 if previous_page:
-                    parsed_url = urlparse(previous_page)
-                    self.navigate(parsed_url.path, record_history=False, server=parsed_url.hostname,
-                                  port=parsed_url.port)
+                    server, port, selector = previous_page
+                    self.navigate(selector, record_history=False, server=server, port=port)
                     return "BACK"  # Indicate that we're going back
                 else:
                     print("You're at the beginning of your navigation history.")
             elif choice == 'q':
-                sys.exit(0)
+                self.quit_client()
+                return "QUIT"
             else:
                 print("Invalid choice. Please try again.")
 
@@ -255,7 +333,7 @@ class GopherClient:
 
     def search(self, query, engine):
         """Search the Gopher server."""
-        search_engine = next((e for e in self.search_engines if e['name'] == engine), None)
+        search_engine = self._search_engines_by_name.get(engine)
         if not search_engine:
             print(f"Search engine {engine} not found.")
             return
@@ -264,29 +342,31 @@ class GopherClient:
         port = search_engine.get('port', 70)  # Use port 70 as default if not specified
         selector = search_engine['selector'] + query
 
-        # Connect to the search engine's server and send the search query
+        # Point the client at the search engine's server; navigate sends the query
         self.host = hostname
         self.port = port
-        self.connect()
-        data = self._send_request(selector)
 
-        if data:
-            # Navigate to the search results without recording history
-            self.navigate(selector, record_history=False)
+        # Navigate to the search results without recording history
+        self.navigate(selector, record_history=False)
 
     def save_bookmark(self, title, selector):
-        existing = [bookmark for bookmark in self.bookmarks if bookmark['selector'] == selector]
-        if existing:
+        if selector in self._bookmark_selectors:
             print(f"'{title}' is already bookmarked.")
             return
         self.bookmarks.append({'title': title, 'selector': selector})
+        self._bookmark_selectors.add(selector)
         self._save_to_file(BOOKMARKS_FILE, self.bookmarks)
         print(f"Saved '{title}' as a bookmark.")
 
+    def _index_bookmarks(self):
+        """Rebuild the set of bookmarked selectors used for duplicate checks."""
+        self._bookmark_selectors = {bm['selector'] for bm in self.bookmarks}
+
     def delete_bookmark(self, index):
         """Delete a bookmark by its index."""
         try:
             deleted_bookmark = self.bookmarks.pop(index)
+            self._index_bookmarks()
             self._save_to_file(BOOKMARKS_FILE, self.bookmarks)
             print(f"Deleted bookmark '{deleted_bookmark['title']}'.")
         except IndexError:
@@ -300,6 +380,7 @@ class GopherClient:
                 bookmark['title'] = new_title
             if new_selector:
                 bookmark['selector'] = new_selector
+                self._index_bookmarks()
             self._save_to_file(BOOKMARKS_FILE, self.bookmarks)
             print(f"Modified bookmark to '{bookmark['title']}' - '{bookmark['selector']}'.")
         except IndexError:
@@ -327,11 +408,12 @@ class GopherClient:
 
     def save_config(self):
         """Save configuration to a local file."""
+        history = self.history_manager.serialize()
         config = {
             'hostname': self.host,
             'port': self.port,
-            'backward_history': self.history_manager.backward_history,
-            'forward_history': self.history_manager.forward_history
+            'backward_history': history['backward'],
+            'forward_history': history['forward']
         }
         self._save_to_file(CONFIG_FILE, config)
         print(f"Configuration saved to {CONFIG_FILE}.")
@@ -341,8 +423,8 @@ class GopherClient:
         config = self._load_from_file(CONFIG_FILE)
         self.host = config.get('hostname', self.host)
         self.port = config.get('port', self.port)
-        self.history_manager.backward_history = config.get('backward', self.history_manager.backward_history)
-        self.history_manager.forward_history = config.get('forward', self.history_manager.forward_history)
+        if 'backward_history' in config or 'forward_history' in config:
+            self.history_manager.restore(config.get('backward_history', []), config.get('forward_history', []))
 
     def display_help(self):
         """Display usage instructions."""
@@ -374,128 +456,211 @@ class GopherClient:
         except (ValueError, IndexError):
             print("Invalid choice. Please select a valid bookmark number.")
 
-    def _split_address(self, address):
-        # Remove the 'gopher://' prefix if it exists
-        if address.startswith("gopher://"):
-            address = address[len("gopher://"):]
-
-        # Split based on the first '/'
-        parts = address.split('/', 1)
-        server_port = parts[0]
-        selector = parts[1] if len(parts) > 1 else ""
-
-        # If ':' is present, then we have a port number
-        if ':' in server_port:
-            server, port = server_port.split(':', 1)
-        else:
-            server = server_port
-            port = "70"  # Default Gopher port as string
-
-        return server, port, selector
-
     def _go_back(self):
         """Navigate back to the previous page."""
         print("Attempting to go back...")
 
-        # Validating history data: Ensure backward_history contains valid URLs
+        # Validating history data: Ensure backward_history has entries
         if not self.history_manager.backward_history:
             print("You're at the beginning of your navigation history.")
             return
 
         prev_page = self.history_manager.go_back()
 
-        # Validating history data: Ensure history_manager.go_back() returns valid URLs
+        # Validating history data: Ensure history_manager.go_back() returns an entry
         if not prev_page:
             print("You're at the beginning of your navigation history.")
             return
 
-        server, port, selector = self._split_address(prev_page)
-        self.logging.debug(f"Going back to: {server}:{port}/{selector}")
+        server, port, selector = prev_page
+        self.logging.debug("Going back to: %s:%s/%s", server, port, selector)
         self.navigate(selector, record_history=False, server=server, port=port)
 
     def _error_handler(self, error_message, error_type="General", debug_info=None):
-        self.logging.error(f"{error_type} Error: {error_message}", exc_info=True)
+        self.logging.error(f"{error_type} Error: {error_message}", exc_info=True, stacklevel=2)
 
-    def _is_connected(self):
-        """Check if the connection is alive."""
+    def _open_socket(self, server, port):
+        """Open and configure a new socket to server:port."""
+        start_time = time.time()
+        self.logging.debug("Attempting to establish connection to %s:%s", server, port)
+        sock = socket.create_connection((server, port), self.timeout)
+        # Send the short selector line immediately instead of waiting on Nagle
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.logging.debug("Connection established to %s:%s in %.2f seconds", server, port,
+                           time.time() - start_time)
+        return sock
+
+    def _peer_alive(self, sock):
+        """Check that an idle socket has not been closed or reset by the server."""
         try:
-            # Check if socket is still connected
-            return self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
-        except (socket.error, AttributeError):
+            sock.setblocking(False)
+            return sock.recv(1, socket.MSG_PEEK) != b""
+        except BlockingIOError:
+            return True  # Nothing to read yet: the connection is still open
+        except socket.error:
             return False
+        finally:
+            sock.settimeout(self.timeout)
+
+    def _socket_connect(self, server, port):
+        """Return a pooled or prefetched connection to server:port, opening a new one if needed."""
+        key = (server, port)
+        sock = self._conn_pool.get(key)
+        if sock:
+            if self._peer_alive(sock):
+                self.logging.debug("Reusing pooled connection to %s:%s", server, port)
+                self.socket = sock
+                return sock
+            self._socket_release(server, port)
 
-    def _establish_connection(self, server=None, port=None):
         try:
-            start_time = time.time()
-            if self.socket:
-                self.socket.close()
-            self.logging.debug(
-                f"[{self._establish_connection.__name__}:{self._establish_connection.__code__.co_firstlineno}] Attempting to establish connection to {server or self.host}:{port or self.port}")
-            self.socket = socket.create_connection((server or self.host, port or self.port), self.timeout)
-            self.logging.debug(
-                f"[{self._establish_connection.__name__}:{self._establish_connection.__code__.co_firstlineno}] Connection established to {server or self.host}:{port or self.port} in {time.time() - start_time:.2f} seconds")
+            sock = self._take_prefetched(key) or self._open_socket(server, port)
         except socket.error as e:
             self._error_handler(f"Error establishing connection: {e}", debug_info=e)
+            self.socket = None
+            return None
+
+        self._conn_pool[key] = sock
+        self.socket = sock
+        return sock
+
+    def _socket_release(self, server, port):
+        """Evict the connection to server:port from the pool and close it."""
+        sock = self._conn_pool.pop((server, port), None)
+        if sock:
+            sock.close()
+            if self.socket is sock:
+                self.socket = None
+
+    def _prefetch_connections(self, entries):
+        """Start connecting to the first few distinct servers of a menu while the user reads it."""
+        self._discard_prefetch()
+        for entry_type, _, _, server, port in entries:
+            if len(self._prefetch) >= PREFETCH_MAX_HOSTS:
+                break
+            if entry_type not in PREFETCH_ENTRY_TYPES:
+                continue
+            try:
+                key = (server, int(port.strip()))
+            except ValueError:
+                continue
+            if key not in self._prefetch and key not in self._conn_pool:
+                self.logging.debug("Prefetching connection to %s:%s", *key)
+                self._prefetch[key] = self._start_prefetch(*key)
+
+    def _start_prefetch(self, server, port):
+        """
+        Open a connection to server:port on a daemon thread and return a Future for the socket.
+
+        Each prefetch gets its own thread so a stalled host cannot delay the others, and
+        daemon threads never hold up interpreter exit on a hanging connect or DNS lookup.
+        """
+        future = Future()
 
-    def _ensure_connection(self):
-        if not self._is_connected():
-            self.logging.debug(
-                f"[{self._ensure_connection.__name__}:{self._ensure_connection.__code__.co_firstlineno}] Connection lost. Reconnecting...")
-            self.connect(self.host, self.port)
+        def connect():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self._open_socket(server, port))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=connect, daemon=True).start()
+        return future
+
+    def _take_prefetched(self, key):
+        """
+        Claim the prefetched connection for key, if one succeeded, and drop the rest.
+
+        Raises socket.timeout if the host's own connect timed out, so a dead host is not
+        retried with a second full timeout.
+        """
+        future = self._prefetch.pop(key, None)
+        self._discard_prefetch()
+        if future is None:
+            return None
+        wait([future], timeout=self.timeout)
+        if not future.done():
+            # Still resolving or connecting: close the socket if it completes late, connect afresh
+            future.add_done_callback(_close_prefetched_socket)
+            self.logging.debug("Prefetched connection to %s:%s still pending", *key)
+            return None
+        error = future.exception()
+        if isinstance(error, socket.timeout):
+            raise socket.timeout(f"timed out connecting to {key[0]}:{key[1]}") from error
+        if error is not None:
+            # Fall back to a fresh connection
+            self.logging.debug("Prefetched connection to %s:%s failed: %s", *key, error)
+            return None
+        sock = future.result()
+        if not self._peer_alive(sock):
+            sock.close()
+            return None
+        self.logging.debug("Using prefetched connection to %s:%s", *key)
+        return sock
+
+    def _discard_prefetch(self):
+        """Cancel or close every outstanding prefetched connection."""
+        for future in self._prefetch.values():
+            if not future.cancel():
+                future.add_done_callback(_close_prefetched_socket)
+        self._prefetch.clear()
 
     def _send_request(self, selector, server=None, port=None):
         start_time = time.time()
-        response = b""
-        self._debug_print(
-            f"[{self._send_request.__name__}:{self._send_request.__code__.co_firstlineno}] Sending request with selector: {selector}")
+        chunks = []
+        self.logging.debug("Sending request with selector: %s", selector)
 
         try:
             if not server:
                 server = self.host
             if not port:
                 port = self.port
+            port = int(port)
 
-            self._establish_connection(server, port)  # Pass the server and port to the connection method
-            self.socket.sendall((selector + "\r\n").encode())
+            if not self._socket_connect(server, port):
+                return None
+            self.socket.sendall(selector.encode('utf-8') + _CRLF)
 
             while True:
-                chunk = self.socket.recv(4096)
+                chunk = self.socket.recv(RECV_BUFSIZE)
                 if not chunk:
+                    # Gopher servers close the stream after the response; drop the dead socket
+                    self._socket_release(server, port)
                     break
-                response += chunk
-
-            self.socket.close()
+                chunks.append(chunk)
 
-            decoded_response = response.decode('utf-8', errors='replace')
-            self.logging.debug(
-                f"[{self._send_request.__name__}:{self._send_request.__code__.co_firstlineno}] Received response: {decoded_response[:100]}...")
-            self.logging.debug(
-                f"[{self._send_request.__name__}:{self._send_request.__code__.co_firstlineno}] _send_request took {time.time() - start_time:.2f} seconds to execute")
-            return decoded_response
+            response = b"".join(chunks)
+            self.logging.debug("Received response: %.100r...", response)
+            self.logging.debug("_send_request took %.2f seconds to execute", time.time() - start_time)
+            return response
         except (socket.error, Exception) as e:
             self._error_handler(f"Error: {e}")
+            # A half-read connection must never be reused for the next selector
+            self._socket_release(server, port)
             return None
 
     def _parse_gopher_menu(self, menu_data):
-        self.logging.debug(
-            f"[{self._parse_gopher_menu.__name__}:{self._parse_gopher_menu.__code__.co_firstlineno}] Parsing gopher menu: {menu_data[:100]}...")
+        """Parse raw menu bytes in a single pass; returns (entries, total line count)."""
+        self.logging.debug("Parsing gopher menu: %.100r...", menu_data)
         entries = []
-        lines = menu_data.split("\n")
+        # Split as bytes and decode only the fields of menu lines
+        lines = menu_data.split(b"\n")
         for line in lines:
-            parts = line.split("\t")
-            if len(parts) >= 4:
-                entry_type = parts[0][0]
-                display_string = parts[0][1:]
-                selector = parts[1]
-                server = parts[2]
-                port = parts[3]
+            parts = line.split(b"\t", 4)
+            if len(parts) >= 4:  # A valid gopher menu line has at least 3 tabs
+                entry_type = _decode(parts[0][:1])
+                display_string = _decode(parts[0][1:])
+                selector = _decode(parts[1])
+                server = _decode(parts[2])
+                port = _decode(parts[3])
                 entries.append((entry_type, display_string, selector, server, port))
-        return entries
+        return entries, len(lines)
 
     def _get_user_choice(self, entries):
         while True:
             choice = input("Select an option: ")
-            self.logging.debug(f"User selected choice: {choice}")
+            self.logging.debug("User selected choice: %s", choice)
 
             if choice.isdigit() and 0 <= int(choice) < len(entries):
                 return entries[int(choice)]
@@ -506,17 +671,16 @@ class GopherClient:
                 return None, None, None
             elif choice == 'q':
                 self.quit_client()
+                return None, None, None
             print("Invalid choice. Please try again.")
 
     def _display_gopher_menu(self, data):
-        lines = data.split("\n")
-        menu_line_count = sum(
-            1 for line in lines if line.count('\t') >= 3)  # A valid gopher menu line has at least 3 tabs
+        entries, line_count = self._parse_gopher_menu(data)
 
         # Check if at least 20% of the lines seem to represent a menu
-        if menu_line_count > len(lines) * 0.20:
-            entries = self._parse_gopher_menu(data)
+        if len(entries) > line_count * 0.20:
             self._print_gopher_menu(entries)
+            self._prefetch_connections(entries)
             selected_item = self._get_user_choice(entries)
             if selected_item:
                 _, _, selector, server, port = selected_item if len(selected_item) == 5 else (
@@ -527,7 +691,7 @@ class GopherClient:
             return None, None, None
         else:
             # Handle cases where data doesn't seem to be a Gopher menu
-            print(data)
+            print(_decode(data))
             print("\nPress 'b' to go back or 'q' to quit:")
             return None, None, None
 
@@ -539,11 +703,21 @@ class GopherClient:
         print("b. Go back")
 
     def _load_from_file(self, filename, default_value=[]):
+        with self._save_lock:
+            if filename in self._pending_saves:
+                return self._pending_saves[filename]
         if not os.path.exists(filename):
             return default_value
         try:
-            with open(filename, 'r') as f:
-                return json.load(f)
+            # Serve from the in-memory cache unless the file changed on disk
+            mtime = os.path.getmtime(filename)
+            cached = self._file_cache.get(filename)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            with open(filename, 'rb') as f:
+                data = _loads(f.read())
+            self._file_cache[filename] = (mtime, data)
+            return data
         except IOError as e:
             self.logging.error(f"Error opening or reading from {filename}: {e}")
         except json.JSONDecodeError as e:
@@ -553,41 +727,28 @@ class GopherClient:
         return default_value
 
     def _save_to_file(self, filename, data):
-        self.logging.debug(
-            f"[{self._save_to_file.__name__}:{self._save_to_file.__code__.co_firstlineno}] Saving data to {filename}")
-
-        # Backup original file
-        backup_filename = filename + ".bak"
-        if os.path.exists(filename):
-            try:
-                import shutil
-                shutil.copy2(filename, backup_filename)
-            except Exception as e:
-                self.logging.error(f"Error while creating a backup: {e}")
-                return
-
-        # Try to save the new data
-        try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=4)
-        except (IOError, json.JSONDecodeError) as e:
-            self.logging.error(f"Error while saving data to {filename}: {e}")
-
-            # Restore from backup in case of any error
-            if os.path.exists(backup_filename):
+        """Queue data for filename; saves within SAVE_COALESCE_DELAY seconds are written once."""
+        self.logging.debug("Saving data to %s", filename)
+        with self._save_lock:
+            self._pending_saves[filename] = data
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_COALESCE_DELAY, self._flush_saves)
+                self._save_timer.start()
+
+    def _flush_saves(self):
+        """Write every queued save to disk."""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            pending, self._pending_saves = self._pending_saves, {}
+            for filename, data in pending.items():
                 try:
-                    shutil.copy2(backup_filename, filename)
-                except Exception as restore_error:
-                    self.logging.error(f"Error while restoring from backup: {restore_error}")
-                    return
-            return
-
-        # If everything went fine, remove the backup
-        if os.path.exists(backup_filename):
-            try:
-                os.remove(backup_filename)
-            except Exception as remove_error:
-                self.logging.error(f"Error while removing backup: {remove_error}")
+                    _write_json_atomic(filename, data)
+                except (IOError, TypeError, ValueError) as e:
+                    self.logging.error(f"Error while saving data to {filename}: {e}")
+                    continue
+                self._file_cache[filename] = (os.path.getmtime(filename), data)
 
 
 def main():